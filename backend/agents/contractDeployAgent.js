@@ -4,6 +4,9 @@ import util from 'util';
 import Web3 from 'web3';
 import fs from 'fs/promises';
 import path from 'path';
+import v8 from 'v8';
+import http from 'http';
+import https from 'https';
 import { fileURLToPath } from 'url';
 import { dirname } from 'path';
 import axios from 'axios';
@@ -80,9 +83,229 @@ const quantumDelay = (ms) => new Promise(resolve => {
   setTimeout(resolve, ms + jitter);
 });
 
+// === 🛰️ BSC RPC Endpoints (Primary + Public Fallbacks) ===
+const BSC_PUBLIC_RPC_URLS = [
+  'https://bsc-dataseed.binance.org',
+  'https://bsc-dataseed1.defibit.io',
+  'https://bsc-dataseed1.ninicoin.io',
+  'https://bsc-rpc.publicnode.com'
+];
+const RPC_PROBE_TIMEOUT_MS = 2000;
+
+const getRpcUrls = (CONFIG) => [...new Set([CONFIG.BSC_NODE, ...BSC_PUBLIC_RPC_URLS].filter(Boolean))];
+
+const sleep = (ms) => new Promise(resolve => setTimeout(resolve, ms));
+
+// === 🔌 Pooled RPC Client (Keep-Alive Sockets Shared by Probes and Deploy Traffic) ===
+const rpcClient = axios.create({
+  timeout: 5000,
+  headers: { 'Content-Type': 'application/json' },
+  httpAgent: new http.Agent({ keepAlive: true, maxSockets: 8 }),
+  httpsAgent: new https.Agent({ keepAlive: true, maxSockets: 8 })
+});
+
+// === 🛰️ Concurrent RPC Health Check: rank endpoints by latency ===
+const probeRpc = async (url) => {
+  const start = Date.now();
+  const { data } = await rpcClient.post(
+    url,
+    { jsonrpc: '2.0', id: 1, method: 'eth_blockNumber', params: [] },
+    { timeout: RPC_PROBE_TIMEOUT_MS }
+  );
+  if (!data?.result) throw new Error(`RPC probe ${url} returned no block number`);
+  return { url, latency: Date.now() - start };
+};
+
+// Healthy endpoints fastest-first, unreachable ones kept last as a final fallback
+const rankRpcEndpoints = async (urls) => {
+  const results = await Promise.allSettled(urls.map(probeRpc));
+  const healthy = results
+    .filter(r => r.status === 'fulfilled')
+    .map(r => r.value)
+    .sort((a, b) => a.latency - b.latency);
+  if (healthy.length === 0) throw new Error(`No reachable RPC endpoint: ${urls.join(', ')}`);
+
+  console.log(`🛰️ Primary RPC: ${healthy[0].url} (${healthy[0].latency}ms, ${healthy.length}/${urls.length} healthy)`);
+  const ranked = healthy.map(({ url }) => url);
+  return [...ranked, ...urls.filter(url => !ranked.includes(url))];
+};
+
+// === 🔁 Rotating RPC Provider (Backoff-Aware Failover) ===
+const RATE_LIMIT_RPC_CODES = new Set([-32005, -32090]);
+
+const isRateLimited = (response) => [].concat(response).some(({ error } = {}) =>
+  RATE_LIMIT_RPC_CODES.has(error?.code) || /rate limit|too many requests/i.test(error?.message ?? '')
+);
+
+// Transport failures, 429 and 5xx may succeed elsewhere; other HTTP errors are deterministic
+const isRetryableHttpError = (error) => !error.response || error.response.status === 429 || error.response.status >= 500;
+
+class RotatingRpcProvider {
+  constructor(urls, { initialBackoffMs = 250, maxBackoffMs = 30000, requestTimeoutMs = 5000, requestDeadlineMs = 30000 } = {}) {
+    this.endpoints = urls.map(url => ({ url, readyAt: 0, backoffMs: initialBackoffMs }));
+    this.initialBackoffMs = initialBackoffMs;
+    this.maxBackoffMs = maxBackoffMs;
+    this.requestTimeoutMs = requestTimeoutMs;
+    this.requestDeadlineMs = requestDeadlineMs;
+    this.maxAttempts = urls.length * 3;
+  }
+
+  // Earliest-ready endpoint; ties keep list order so the primary stays preferred
+  _nextEndpoint() {
+    return this.endpoints.reduce((best, e) => (e.readyAt < best.readyAt ? e : best));
+  }
+
+  _backOff(endpoint, retryAfterMs) {
+    const delayMs = Math.min(retryAfterMs ?? endpoint.backoffMs, this.maxBackoffMs);
+    endpoint.readyAt = Date.now() + delayMs;
+    endpoint.backoffMs = Math.min(endpoint.backoffMs * 2, this.maxBackoffMs);
+  }
+
+  _recover(endpoint) {
+    endpoint.readyAt = 0;
+    endpoint.backoffMs = this.initialBackoffMs;
+  }
+
+  // One POST to one endpoint. JSON-RPC replies (including deterministic errors) are returned;
+  // retryable failures back the endpoint off and throw with `retryable` set
+  async _attempt(endpoint, payload, timeoutMs) {
+    let data;
+    try {
+      ({ data } = await rpcClient.post(endpoint.url, payload, { timeout: timeoutMs }));
+    } catch (error) {
+      if (!isRetryableHttpError(error)) {
+        // Some providers send reverts and other JSON-RPC errors with HTTP 400
+        if (error.response?.data?.error) return error.response.data;
+        throw error;
+      }
+      const retryAfter = Number(error.response?.headers?.['retry-after']);
+      this._backOff(endpoint, Number.isFinite(retryAfter) ? retryAfter * 1000 : undefined);
+      throw Object.assign(error, { retryable: true });
+    }
+
+    if (isRateLimited(data)) {
+      this._backOff(endpoint);
+      throw Object.assign(new Error(`${endpoint.url} rate limited`), { retryable: true });
+    }
+    this._recover(endpoint);
+    return data;
+  }
+
+  async request(payload) {
+    const deadline = Date.now() + this.requestDeadlineMs;
+    let lastError;
+    for (let attempt = 0; attempt < this.maxAttempts; attempt++) {
+      const endpoint = this._nextEndpoint();
+      const waitMs = Math.max(0, endpoint.readyAt - Date.now());
+      const remainingMs = deadline - Date.now() - waitMs;
+      if (remainingMs <= 0) break;
+      if (waitMs > 0) await sleep(waitMs);
+
+      try {
+        return await this._attempt(endpoint, payload, Math.min(this.requestTimeoutMs, remainingMs));
+      } catch (error) {
+        if (!error.retryable) throw error;
+        lastError = error;
+      }
+    }
+    throw new Error(`All RPC endpoints failed for ${payload.method ?? 'batch request'}: ${lastError?.message ?? 'deadline exceeded'}`);
+  }
+
+  // Single attempt on the earliest-ready endpoint, outside the retry loop, for calls the caller must not see re-sent
+  async requestOnce(payload, { timeoutMs = this.requestTimeoutMs } = {}) {
+    const endpoint = this._nextEndpoint();
+    const waitMs = endpoint.readyAt - Date.now();
+    if (waitMs > 0) await sleep(waitMs);
+    return this._attempt(endpoint, payload, timeoutMs);
+  }
+}
+
+// === ⏳ Receipt Polling (Exponential Backoff) ===
+const RECEIPT_TIMEOUT_MS = 120000;
+
+const waitForReceipt = async (web3, txHash, { timeoutMs = RECEIPT_TIMEOUT_MS, initialDelayMs = 1000, maxDelayMs = 4000 } = {}) => {
+  const deadline = Date.now() + timeoutMs;
+  let delayMs = initialDelayMs;
+  while (Date.now() < deadline) {
+    const receipt = await web3.requestManager.send({ method: 'eth_getTransactionReceipt', params: [txHash] });
+    if (receipt) return receipt;
+    await sleep(delayMs);
+    delayMs = Math.min(delayMs * 1.5, maxDelayMs);
+  }
+  throw new Error(`Transaction ${txHash} not mined within ${timeoutMs / 1000}s`);
+};
+
+// === ⛽ Gas Price (One eth_gasPrice Call per Run, Shared Across Deployments) ===
+// BSC pins baseFeePerGas at 0 (BEP-226), so a legacy type-0 price signed with an explicit
+// gasPrice costs the same as EIP-1559 and lets web3 sign without re-fetching fee data
+const getGasPrice = async (web3) => {
+  const gasPrice = await web3.requestManager.send({ method: 'eth_gasPrice', params: [] });
+  if (!gasPrice || BigInt(gasPrice) === 0n) throw new Error('eth_gasPrice returned no price');
+  return { type: '0x0', gasPrice };
+};
+
+// === 🧯 Broadcast Circuit Breaker (Timeout → Fail Over → Retry) ===
+const BROADCAST_TIMEOUT_MS = 10000;
+const KNOWN_TRANSACTION_PATTERN = /already known|known transaction/i;
+
+const isTransactionKnown = async (web3, txHash) => {
+  try {
+    return Boolean(await web3.requestManager.send({ method: 'eth_getTransactionByHash', params: [txHash] }));
+  } catch {
+    return false;
+  }
+};
+
+// Re-sends the same signed transaction, one endpoint per attempt, so a retry can never double-deploy
+const broadcastWithFailover = async (web3, rpcProvider, signedTx) => {
+  const payload = { jsonrpc: '2.0', id: 1, method: 'eth_sendRawTransaction', params: [signedTx.rawTransaction] };
+  let failure;
+
+  for (let attempt = 1; attempt <= rpcProvider.endpoints.length; attempt++) {
+    let response;
+    try {
+      response = await rpcProvider.requestOnce(payload, { timeoutMs: BROADCAST_TIMEOUT_MS });
+    } catch (error) {
+      failure = error;
+      if (!error.retryable) break;
+      console.warn(`⚠️ Broadcast attempt ${attempt} failed (${error.message}) → failing over to next RPC`);
+      continue;
+    }
+
+    // A node already holding this exact transaction means an earlier attempt reached the mempool
+    if (!response.error || KNOWN_TRANSACTION_PATTERN.test(response.error.message)) return signedTx.transactionHash;
+    failure = new Error(`Broadcast rejected: ${response.error.message}`);
+    break;
+  }
+
+  // A timed-out attempt may still have landed; confirm before reporting failure
+  if (await isTransactionKnown(web3, signedTx.transactionHash)) return signedTx.transactionHash;
+  throw failure;
+};
+
+// === 📇 Recipient Wallets (USDT_WALLETS) ===
+const ADDRESS_PATTERN = /^0x[0-9a-fA-F]{40}$/;
+
+// Single-case hex carries no checksum; mixed case must match its EIP-55 checksum
+const isMixedCase = (addr) => {
+  const hex = addr.slice(2);
+  return hex !== hex.toLowerCase() && hex !== hex.toUpperCase();
+};
+
+// Cheap structural check first; keccak work only runs on well-formed addresses
+const parseRecipientWallets = (csv) => (csv ?? '')
+  .split(',')
+  .map(addr => addr.trim())
+  .filter(Boolean)
+  .map(addr => {
+    if (!ADDRESS_PATTERN.test(addr) || (isMixedCase(addr) && !Web3.utils.checkAddressChecksum(addr))) {
+      throw new Error(`Invalid address in USDT_WALLETS: ${addr}`);
+    }
+    return Web3.utils.toChecksumAddress(addr);
+  });
+
 // === 💰 Self-Funding: Get Initial Capital from Revenue Agents ===
-async function getInitialCapital(CONFIG) {
-  const web3 = new Web3(CONFIG.BSC_NODE);
+async function getInitialCapital(CONFIG, web3) {
   const balance = await web3.eth.getBalance(CONFIG.GAS_WALLET);
   const bnbBalance = web3.utils.fromWei(balance, 'ether');
 
@@ -119,6 +342,51 @@ async function getInitialCapital(CONFIG) {
   return true;
 }
 
+// === 📦 Artifact Loader (Memoized, Invalidated on Recompile) ===
+const ARTIFACTS_DIR = path.resolve(__dirname, '../artifacts/contracts');
+const CONTRACT_SOURCES = Object.freeze({
+  RevenueDistributor: 'RevenueDistributor.sol'
+});
+const artifactCache = new Map();
+
+// Serialized { abi, bytecode } next to the artifact survives process restarts
+const readArtifact = async (artifactPath, mtimeMs) => {
+  const cachePath = `${artifactPath}.v8cache`;
+  try {
+    const { mtimeMs: cacheMtimeMs } = await fs.stat(cachePath);
+    if (cacheMtimeMs >= mtimeMs) return v8.deserialize(await fs.readFile(cachePath));
+  } catch { /* cache miss */ }
+
+  const { abi, bytecode } = JSON.parse(await fs.readFile(artifactPath, 'utf8'));
+  try {
+    await fs.writeFile(cachePath, v8.serialize({ abi, bytecode }));
+  } catch (cacheError) {
+    console.warn(`⚠️ Failed to write artifact cache ${cachePath}:`, cacheError.message);
+  }
+  return { abi, bytecode };
+};
+
+const loadContractArtifact = async (contractName) => {
+  const sourceFile = CONTRACT_SOURCES[contractName];
+  if (!sourceFile) throw new Error(`No source file registered for contract ${contractName}`);
+
+  const artifactPath = path.join(ARTIFACTS_DIR, sourceFile, `${contractName}.json`);
+  const { mtimeMs } = await fs.stat(artifactPath);
+  const cached = artifactCache.get(contractName);
+  if (cached?.mtimeMs === mtimeMs) return cached;
+
+  const { abi, bytecode } = await readArtifact(artifactPath, mtimeMs);
+  const artifact = {
+    mtimeMs,
+    abi,
+    bytecode: bytecode.startsWith('0x') ? bytecode : `0x${bytecode}`,
+    // Constructor input types are all deploy-data encoding needs; keeps Contract objects out of the cache
+    constructorInputs: abi.find(entry => entry.type === 'constructor')?.inputs ?? []
+  };
+  artifactCache.set(contractName, artifact);
+  return artifact;
+};
+
 // === 🔐 Secure Key Access (No Direct Exposure) ===
 const getPrivateKey = () => {
   if (!process.env.PRIVATE_KEY) {
@@ -127,6 +395,12 @@ const getPrivateKey = () => {
   return process.env.PRIVATE_KEY;
 };
 
+// === 🔐 Deployer Account (Derived Once per Run, Bound to That Run's Web3) ===
+const getDeployerAccount = (web3) => {
+  const privateKey = getPrivateKey();
+  return web3.eth.accounts.privateKeyToAccount(privateKey.startsWith('0x') ? privateKey : `0x${privateKey}`);
+};
+
 // === 🧩 Contract Deploy Agent (BSC Mainnet) ===
 export const contractDeployAgent = async (CONFIG) => {
   try {
@@ -135,15 +409,24 @@ export const contractDeployAgent = async (CONFIG) => {
       return;
     }
 
+    // Probed, rotating RPC access is shared by every chain call below, funding check included
+    const rpcUrls = getRpcUrls(CONFIG);
+    const rpcProvider = new RotatingRpcProvider(await rankRpcEndpoints(rpcUrls));
+    const web3 = new Web3(rpcProvider);
+
+    // Deployer signs locally (never added to the web3 wallet) and must be the funded gas wallet
+    const deployer = getDeployerAccount(web3);
+    if (deployer.address.toLowerCase() !== CONFIG.GAS_WALLET.toLowerCase()) {
+      throw new Error(`PRIVATE_KEY address ${deployer.address} does not match GAS_WALLET ${CONFIG.GAS_WALLET}`);
+    }
+
     // ===== 1. SELF-FUNDING: GET INITIAL CAPITAL =====
-    const hasCapital = await getInitialCapital(CONFIG);
+    const hasCapital = await getInitialCapital(CONFIG, web3);
     if (!hasCapital) {
       console.warn('⚠️ Failed to generate initial capital. Skipping contract deployment.');
       return;
     }
 
-    const web3 = new Web3(CONFIG.BSC_NODE || 'https://bsc-dataseed.binance.org');
-
     // 1. Compile Contracts
     console.log('📦 Compiling contracts with Hardhat...');
     try {
@@ -154,66 +437,92 @@ export const contractDeployAgent = async (CONFIG) => {
       throw new Error('Contract compilation failed');
     }
 
-    // 2. Get Gas Price from BscScan
-    let gasPrice;
+    // 2. Resolve the gas price once for every deployment (node price, BscScan oracle as fallback)
+    let fees;
     try {
-      const gasResponse = await axios.get('https://api.bscscan.com/api', {
-        params: {
-          module: 'gastracker',
-          action: 'gasoracle',
-          apikey: CONFIG.BSCSCAN_API_KEY
-        },
-        timeout: 10000
-      });
-
-      gasPrice = web3.utils.toWei(gasResponse.data.result.SafeGasPrice, 'gwei');
-    } catch (gasError) {
-      console.warn('⚠️ Failed to fetch gas price → using default 5 Gwei');
-      gasPrice = web3.utils.toWei('5', 'gwei');
-    }
-
-    // 3. Load Wallet
-    const account = web3.eth.accounts.privateKeyToAccount(getPrivateKey());
-    web3.eth.accounts.wallet.add(account);
-
-    // 4. Deploy Function
-    const deployContract = async (contractName, args = []) => {
-      const artifactPath = path.resolve(__dirname, `../artifacts/contracts/${contractName}.sol/${contractName}.json`);
-
+      fees = await getGasPrice(web3);
+    } catch (feeError) {
+      console.warn('⚠️ eth_gasPrice failed → falling back to BscScan gas oracle:', feeError.message);
       try {
-        const artifact = JSON.parse(await fs.readFile(artifactPath, 'utf8'));
-        const { abi, bytecode } = artifact;
-
-        const contract = new web3.eth.Contract(abi);
-        const deployTx = contract.deploy({ data: '0x' + bytecode, arguments: args });
+        const gasResponse = await axios.get('https://api.bscscan.com/api', {
+          params: {
+            module: 'gastracker',
+            action: 'gasoracle',
+            apikey: CONFIG.BSCSCAN_API_KEY
+          },
+          timeout: 10000
+        });
 
-        const estimatedGas = await deployTx.estimateGas({ from: CONFIG.GAS_WALLET });
+        fees = { type: '0x0', gasPrice: web3.utils.toWei(gasResponse.data.result.SafeGasPrice, 'gwei') };
+      } catch (gasError) {
+        console.warn('⚠️ Failed to fetch gas price → using default 5 Gwei');
+        fees = { type: '0x0', gasPrice: web3.utils.toWei('5', 'gwei') };
+      }
+    }
 
-        console.log(`🚀 Deploying ${contractName}...`);
-        const deployedContract = await deployTx.send({
-          from: CONFIG.GAS_WALLET,
+    // 3. Deployment Steps: build + sign → broadcast → confirm
+    const prepareDeployment = async (contractName, args = []) => {
+      try {
+        const artifact = await loadContractArtifact(contractName);
+        const data = artifact.bytecode + web3.eth.abi.encodeParameters(artifact.constructorInputs, args).slice(2);
+
+        // Pre-deploy reads share a single HTTP round-trip
+        const batch = new web3.BatchRequest();
+        const [chainId, networkId, nonce, estimatedGas] = await Promise.all([
+          batch.add({ method: 'eth_chainId', params: [] }),
+          batch.add({ method: 'net_version', params: [] }),
+          batch.add({ method: 'eth_getTransactionCount', params: [deployer.address, 'pending'] }),
+          batch.add({ method: 'eth_estimateGas', params: [{ from: deployer.address, data }] }),
+          // web3's default batch timeout (1s) would undercut the provider's own retries
+          batch.execute({ timeout: rpcProvider.requestDeadlineMs })
+        ]);
+
+        const signedTx = await deployer.signTransaction({
+          from: deployer.address,
+          data,
           gas: estimatedGas,
-          gasPrice
+          ...fees,
+          nonce,
+          chainId,
+          networkId
         });
+        return { contractName, signedTx };
+      } catch (deployError) {
+        console.error(`❌ Failed to prepare ${contractName}:`, deployError.message);
+        throw deployError;
+      }
+    };
 
-        console.log(`✅ ${contractName} deployed at: ${deployedContract.options.address}`);
-        return deployedContract;
+    const confirmDeployment = async ({ contractName, signedTx }) => {
+      try {
+        const receipt = await waitForReceipt(web3, signedTx.transactionHash);
+        if (receipt.status !== '0x1') {
+          throw new Error(`${contractName} deployment reverted (tx ${signedTx.transactionHash})`);
+        }
+
+        const address = Web3.utils.toChecksumAddress(receipt.contractAddress);
+        console.log(`✅ ${contractName} deployed at: ${address}`);
+        return address;
       } catch (deployError) {
         console.error(`❌ Failed to deploy ${contractName}:`, deployError.message);
         throw deployError;
       }
     };
 
-    // 5. Deploy RevenueDistributor
-    const revenueDistributor = await deployContract('RevenueDistributor', [
-      CONFIG.USDT_WALLETS?.split(',') || [],
+    // 4. Deploy RevenueDistributor
+    const revenueDistributorTx = await prepareDeployment('RevenueDistributor', [
+      parseRecipientWallets(CONFIG.USDT_WALLETS),
       CONFIG.GAS_WALLET,
       '0x55d398326f99059fF775485246999027B3197955' // USDT on BSC
     ]);
 
-    // 6. Save contract address
+    console.log('🚀 Deploying RevenueDistributor...');
+    await broadcastWithFailover(web3, rpcProvider, revenueDistributorTx.signedTx);
+    const revenueDistributorAddress = await confirmDeployment(revenueDistributorTx);
+
+    // 5. Save contract address
     const contracts = {
-      RevenueDistributor: revenueDistributor.options.address,
+      RevenueDistributor: revenueDistributorAddress,
       deployedAt: new Date().toISOString(),
       network: 'bsc-mainnet'
     };
@@ -226,14 +535,14 @@ export const contractDeployAgent = async (CONFIG) => {
 
     console.log('💾 Contract address saved to contracts.json');
 
-    // 7. Optional: Update Render ENV
+    // 6. Optional: Update Render ENV
     if (process.env.RENDER_API_TOKEN && process.env.RENDER_SERVICE_ID) {
       try {
         await axios.put(
           `https://api.render.com/v1/services/${process.env.RENDER_SERVICE_ID}/env-vars`,
           {
             envVars: [
-              { key: 'REVENUE_DISTRIBUTOR_ADDRESS', value: revenueDistributor.options.address }
+              { key: 'REVENUE_DISTRIBUTOR_ADDRESS', value: revenueDistributorAddress }
             ]
           },
           {